@@ -2,11 +2,22 @@
 Configuration settings for the Weather LLM MCP project
 """
 
+import functools
 import os
+
 from dotenv import load_dotenv
 
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+
+@functools.lru_cache(maxsize=1)
+def load_env():
+    """Load environment variables from the .env file once per process; later calls are free"""
+    load_dotenv(ENV_FILE)
+
+
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 # Weather API Configuration
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
@@ -20,7 +31,8 @@ MCP_SERVER_NAME = "weather-server"
 MCP_SERVER_VERSION = "1.0.0"
 
 # Default settings
-DEFAULT_UNITS = "metric"  # metric, imperial, or kelvin
+DEFAULT_UNITS = os.getenv("DEFAULT_UNITS", "metric")  # metric, imperial, or kelvin
+DEFAULT_LOCATION = os.getenv("DEFAULT_LOCATION", "").strip()
 DEFAULT_LANGUAGE = "en"
 
 # Validation
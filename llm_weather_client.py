@@ -7,17 +7,287 @@ It connects to the weather MCP server and uses an LLM to provide intelligent wea
 """
 
 import asyncio
+import bisect
+import functools
 import json
 import os
+import re
 import subprocess
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from contextlib import AsyncExitStack
 
 from mcp.client.session import ClientSession
-from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.stdio import get_default_environment, stdio_client, StdioServerParameters
 import httpx
 
+from config import load_env
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib codec is used instead
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    input() runs on a daemon thread so background tasks keep making progress while the
+    user types, and a pending read never holds up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _deliver(setter: Callable[[Any], None], value: Any):
+        if not future.done():
+            setter(value)
+
+    def _read():
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError and friends surface in the awaiting coroutine
+            args = (_deliver, future.set_exception, e)
+        else:
+            args = (_deliver, future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(*args)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
+@dataclass(frozen=True)
+class _LLMConfig:
+    """Snapshot of the LLM backend settings read from the environment"""
+    openai_key: str
+    openai_model: str
+    hf_token: str
+    hf_model: str
+    ollama_host: str
+    ollama_model: str
+    favorite_locations: Tuple[str, ...]
+
+    @property
+    def has_llm_backend(self) -> bool:
+        """Whether any LLM backend is configured (Ollama counts unless OLLAMA_HOST is blank)"""
+        return bool(self.openai_key or self.hf_token or self.ollama_host)
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_config() -> _LLMConfig:
+    """Read LLM-related environment variables once and reuse them for every turn."""
+    load_env()
+    raw_favorites = os.getenv("FAVORITE_LOCATIONS", "")
+    return _LLMConfig(
+        openai_key=os.getenv("OPENAI_API_KEY", "").strip(),
+        openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip(),
+        hf_token=os.getenv("HF_API_TOKEN", "").strip(),
+        hf_model=os.getenv("HF_MODEL", "HuggingFaceH4/zephyr-7b-beta").strip(),
+        ollama_host=os.getenv("OLLAMA_HOST", "http://localhost:11434").rstrip("/"),
+        ollama_model=os.getenv("OLLAMA_MODEL", "llama3.1:8b"),
+        favorite_locations=tuple(item.strip() for item in raw_favorites.split(",") if item.strip()),
+    )
+
+
+# Hard deadline for each LLM backend call (DNS, pool acquire, request and streaming), in seconds
+_LLM_DEADLINE = 8.0
+# How long an Ollama /api/tags health probe result is trusted, in seconds
+_OLLAMA_HEALTH_TTL = 60.0
+
+# Menu entries used when FAVORITE_LOCATIONS is not set
+_DEFAULT_FAVORITES = ("London, UK", "New York, US", "Tokyo, JP", "Sydney, AU")
+
+# Favorite-location prefetch: concurrent fetches, how long a prefetched report is reused
+# (kept under the server's 60 s current-weather cache so reports are not served older),
+# and how long shutdown waits for in-flight prefetches
+_PREFETCH_CONCURRENCY = 4
+_PREFETCH_TTL = 30.0
+_PREFETCH_DRAIN_TIMEOUT = 5.0
+
+# Single-pass extractor for the fields of a get_weather report. Labels are followed by
+# [ \t]* rather than \s* so an empty value never runs on into the next line.
+_FIELD_RE = re.compile(
+    r"Temperature:[ \t]*(?P<temperature>[-\d.]+)(?P<temp_unit>°[CF]|K)?[^(\n]*"
+    r"(?:\(feels like[ \t]*(?P<feels_like>[-\d.]+))?"
+    r"|Humidity:[ \t]*(?P<humidity>\d+)"
+    r"|Wind Speed:[ \t]*(?P<wind_speed>[\d.]+)[ \t]*(?P<wind_unit>m/s|mph)?"
+    r"|Visibility:[ \t]*(?P<visibility>\d+)"
+    r"|Conditions:[ \t]*(?P<description>.+)"
+)
+_FIELD_TYPES: Dict[str, Callable[[str], Any]] = {
+    "temperature": float,
+    "feels_like": float,
+    "humidity": int,
+    "wind_speed": float,
+    "visibility": int,
+    "description": str,
+}
+
+# Converters from a report's temperature unit to °C, the unit the tip tables use. Results are
+# rounded to 2 decimals (the API's precision) so float error cannot push a value across a band edge.
+_TO_CELSIUS: Dict[str, Callable[[float], float]] = {
+    "°C": lambda value: value,
+    "°F": lambda value: round((value - 32) * 5 / 9, 2),
+    "K": lambda value: round(value - 273.15, 2),
+}
+
+
+# Temperature suffix and wind speed unit for each tool "units" value, as they appear in the report text
+_UNITS_SUFFIX = {"metric": "°C", "imperial": "°F", "kelvin": "K"}
+_UNITS_WIND = {"metric": "m/s", "imperial": "mph", "kelvin": "m/s"}
+
+
+# Converters from a report's wind speed unit to m/s, the unit the wind thresholds use (rounded as above)
+_TO_MPS: Dict[str, Callable[[float], float]] = {
+    "m/s": lambda value: value,
+    "mph": lambda value: round(value * 0.44704, 2),
+}
+
+
+def _wind_to_mps(fields: Dict[str, Any], unit: Optional[str]) -> Dict[str, Any]:
+    """Convert wind_speed in fields to m/s in place; unknown units drop it."""
+    if "wind_speed" in fields:
+        convert = _TO_MPS.get(unit or "m/s")
+        if convert is None:
+            del fields["wind_speed"]
+        else:
+            fields["wind_speed"] = convert(fields["wind_speed"])
+    return fields
+
+
+def _temperatures_to_celsius(fields: Dict[str, Any], unit: Optional[str]) -> Dict[str, Any]:
+    """Convert temperature and feels_like in fields to °C in place; unknown units drop them."""
+    convert = _TO_CELSIUS.get(unit or "°C")
+    for key in ("temperature", "feels_like"):
+        if key in fields:
+            if convert is None:
+                del fields[key]
+            else:
+                fields[key] = convert(fields[key])
+    return fields
+
+
+def _parse_weather_fields(weather_data: str) -> Dict[str, Any]:
+    """
+    Extract numeric and text fields from a formatted weather report; the first occurrence
+    wins. Temperatures are returned in °C and wind speed in m/s whatever units the report uses.
+    """
+    fields: Dict[str, Any] = {}
+    temp_unit = wind_unit = None
+    for match in _FIELD_RE.finditer(weather_data):
+        for key, raw in match.groupdict().items():
+            if raw is None or key in fields or key not in _FIELD_TYPES:
+                continue
+            try:
+                fields[key] = _FIELD_TYPES[key](raw)
+            except ValueError:
+                continue
+            if key == "temperature":
+                temp_unit = match.group("temp_unit")
+            elif key == "wind_speed":
+                wind_unit = match.group("wind_unit")
+    return _wind_to_mps(_temperatures_to_celsius(fields, temp_unit), wind_unit)
+
+
+def _coerce_weather_fields(payload: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode the server's structured weather JSON into the same shape _parse_weather_fields
+    returns, converting temperatures to °C and wind speed to m/s from the payload's "units".
+    """
+    try:
+        raw = _json_loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(raw, dict):
+        return None
+
+    fields: Dict[str, Any] = {}
+    for key, convert in _FIELD_TYPES.items():
+        value = raw.get(key)
+        if value is None:
+            continue
+        try:
+            fields[key] = convert(value)
+        except (TypeError, ValueError):
+            pass  # e.g. visibility reported as 'N/A'
+    units = raw.get("units", "metric")
+    # Unrecognized units pass through unmapped, so the affected values are dropped rather than guessed
+    _temperatures_to_celsius(fields, _UNITS_SUFFIX.get(units, str(units)))
+    return _wind_to_mps(fields, _UNITS_WIND.get(units, str(units)))
+
+
+# Rule-based tip tables: (at_or_below, at_or_above, tips). A value falls into band
+# bisect_left(at_or_below, value) + bisect_right(at_or_above, value), so edges in the
+# first tuple close a band inclusively and edges in the second open one inclusively.
+_TEMP_BANDS = (
+    (0, 10),
+    (22, 30),
+    (
+        "🥶 Very cold. Wear a heavy coat, gloves, and a hat.",
+        "🧥 Chilly. A warm jacket and layers are recommended.",
+        "🌤️ Mild. A light layer should be enough.",
+        "🌞 Warm and comfortable. T‑shirt or light layers are fine.",
+        "🔥 Hot. Stay hydrated, wear light clothing, and limit midday sun.",
+    ),
+)
+_FEELS_DELTA_BANDS = (
+    (-3,),
+    (3,),
+    (
+        "↘️ It feels colder than the actual temperature—add an extra layer.",
+        None,
+        "↗️ It feels warmer than the actual temperature—dress lightly.",
+    ),
+)
+_HUMIDITY_BANDS = (
+    (30,),
+    (80,),
+    (
+        "💨 Dry air—consider moisturizer and stay hydrated.",
+        None,
+        "💧 Very humid—expect it to feel muggy. Stay hydrated.",
+    ),
+)
+# Wind tips are cumulative: every threshold reached adds its tip
+_WIND_THRESHOLDS = (10, 17)
+_WIND_TIPS = (
+    "💨 Breezy to windy—secure hats/light items and consider a windbreaker.",
+    "🌬️ Strong winds—extra caution for outdoor activities.",
+)
+_LOW_VISIBILITY = 3000
+_PRECIP_RE = re.compile(r"(?P<rain>rain|drizzle|thunder|shower)|(?P<snow>snow)")
+# Ordered by precedence: rain wins over snow when both are mentioned
+_PRECIP_TIPS = (
+    ("rain", "☔ Rain expected. Carry an umbrella or waterproof layer."),
+    ("snow", "❄️ Snowy conditions. Wear insulated boots with good traction."),
+)
+
+
+def _band_tip(value: float, bands: Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[Optional[str], ...]]) -> Optional[str]:
+    """Look up the tip for value in a (at_or_below, at_or_above, tips) band table."""
+    at_or_below, at_or_above, tips = bands
+    return tips[bisect.bisect_left(at_or_below, value) + bisect.bisect_right(at_or_above, value)]
+
 
 class WeatherLLMClient:
     """LLM client that uses MCP for weather data"""
@@ -25,17 +295,52 @@ class WeatherLLMClient:
     def __init__(self):
         self.session: Optional[ClientSession] = None
         self._exit_stack: Optional[AsyncExitStack] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._ollama_alive = False
+        self._ollama_checked_until = 0.0
+        self._prefetch: Dict[str, Tuple[float, "asyncio.Task[Tuple[str, Optional[Dict[str, Any]]]]"]] = {}
+        self._prefetch_limit: Optional[asyncio.Semaphore] = None
+        self._menu_text: Optional[str] = None
     
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client used for LLM backends, creating it on first use"""
+        if self._http is None:
+            # Every backend call is already capped at _LLM_DEADLINE by _race_backends
+            self._http = httpx.AsyncClient(
+                timeout=_LLM_DEADLINE,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+                http2=True,
+            )
+        return self._http
+
+    async def _close_http(self):
+        """Close the pooled HTTP client if it was opened"""
+        if self._http is not None:
+            try:
+                await self._http.aclose()
+            finally:
+                self._http = None
+
     async def connect_to_mcp_server(self):
-        """Connect to the weather MCP server"""
+        """Connect to the weather MCP server, reusing the running server process if already connected"""
+        if self.session is not None:
+            return True
+
         try:
             self._exit_stack = AsyncExitStack()
 
-            # Prepare stdio server parameters to spawn the server
+            # Spawn the server with the SDK's default environment allowlist plus the OpenWeather
+            # key (config has already loaded .env), so the child skips its own .env load and
+            # LLM tokens are not passed to it
+            server_env = get_default_environment()
+            api_key = os.getenv("OPENWEATHER_API_KEY")
+            if api_key:
+                server_env["OPENWEATHER_API_KEY"] = api_key
             server_params = StdioServerParameters(
                 command=sys.executable,
                 args=["weather_mcp_server.py"],
                 cwd=os.path.dirname(os.path.abspath(__file__)),
+                env=server_env,
             )
 
             # Open stdio transport
@@ -47,31 +352,59 @@ class WeatherLLMClient:
             # Initialize the session
             await self.session.initialize()
 
+            # Open the LLM HTTP pool alongside the session so keep-alive connections persist across turns
+            self._http_client()
+
             print("✅ Connected to weather MCP server")
             return True
 
         except Exception as e:
             print(f"❌ Failed to connect to MCP server: {e}")
+            # Tear down the half-open transport so the next call retries instead of reusing a dead session
+            exit_stack, self._exit_stack = self._exit_stack, None
+            self.session = None
+            if exit_stack is not None:
+                try:
+                    await exit_stack.aclose()
+                except Exception:
+                    pass
             return False
     
     async def disconnect(self):
         """Disconnect from the MCP server"""
-        if self._exit_stack is not None:
-            try:
-                await self._exit_stack.aclose()
-            finally:
-                self._exit_stack = None
+        await self._drain_prefetch()
+        try:
+            if self._exit_stack is not None:
+                try:
+                    await self._exit_stack.aclose()
+                finally:
+                    self._exit_stack = None
+                    self.session = None
+        finally:
+            await self._close_http()
     
     async def list_available_tools(self) -> List[Dict[str, Any]]:
-        """List available tools from the MCP server"""
+        """List available tools from the MCP server as name/description/inputSchema dicts"""
         if not self.session:
             raise RuntimeError("Not connected to MCP server")
         
         tools = await self.session.list_tools()
-        return [tool.model_dump() for tool in tools.tools]
+        # Read the attributes callers use directly rather than paying for a full model_dump()
+        return [
+            {"name": tool.name, "description": tool.description, "inputSchema": tool.inputSchema}
+            for tool in tools.tools
+        ]
     
     async def get_weather(self, location: str, units: str = "metric") -> str:
         """Get current weather for a location"""
+        text, _ = await self.get_weather_report(location, units)
+        return text
+
+    async def get_weather_report(self, location: str, units: str = "metric") -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Get current weather as (formatted text, structured fields). The fields come from
+        the JSON block the server sends after the text and are None when it is absent.
+        """
         if not self.session:
             raise RuntimeError("Not connected to MCP server")
         
@@ -82,12 +415,15 @@ class WeatherLLMClient:
             )
             
             if result.content:
-                return result.content[0].text
+                fields = None
+                if len(result.content) > 1:
+                    fields = _coerce_weather_fields(result.content[1].text)
+                return result.content[0].text, fields
             else:
-                return "No weather data received"
+                return "No weather data received", None
                 
         except Exception as e:
-            return f"Error getting weather: {e}"
+            return f"Error getting weather: {e}", None
     
     async def get_forecast(self, location: str, units: str = "metric") -> str:
         """Get weather forecast for a location"""
@@ -108,11 +444,40 @@ class WeatherLLMClient:
         except Exception as e:
             return f"Error getting forecast: {e}"
     
-    def analyze_weather_with_llm(self, weather_data: str, user_query: str) -> str:
+    async def get_weather_bundle(self, location: str, units: str = "metric") -> str:
+        """Get current weather and forecast for a location in a single tool call"""
+        if not self.session:
+            raise RuntimeError("Not connected to MCP server")
+        
+        try:
+            result = await self.session.call_tool(
+                "get_weather_bundle",
+                {"location": location, "units": units}
+            )
+            
+            if result.content:
+                return result.content[0].text
+            else:
+                return "No weather data received"
+                
+        except Exception as e:
+            return f"Error getting weather: {e}"
+    
+    def analyze_weather_with_llm(
+        self, weather_data: str, user_query: str, fields: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
-        Synchronous wrapper preserved for compatibility. Attempts to run async
-        analysis; on failure, returns enhanced rule-based analysis.
+        Synchronous wrapper preserved for external, non-async callers. Attempts to run
+        async analysis; on failure, returns enhanced rule-based analysis.
+
+        Each call starts its own event loop via asyncio.run, so code that is already
+        inside a coroutine must await analyze_weather_with_llm_async instead; when a
+        loop is running this wrapper can only return the rule-based analysis.
         """
+        # Nothing to race without a backend: skip event-loop setup entirely
+        if not _llm_config().has_llm_backend:
+            return self._rule_based_analysis(weather_data, user_query, fields)
+
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
@@ -120,181 +485,195 @@ class WeatherLLMClient:
 
         if loop and loop.is_running():
             # Cannot run new event loop here; fall back to rule-based
-            return self._rule_based_analysis(weather_data, user_query)
-        try:
-            return asyncio.run(self.analyze_weather_with_llm_async(weather_data, user_query))
-        except Exception:
-            return self._rule_based_analysis(weather_data, user_query)
-
-    async def analyze_weather_with_llm_async(self, weather_data: str, user_query: str) -> str:
-        """Async analysis preferring OpenAI, then Hugging Face Inference API, then Ollama, then rule-based."""
-        # 1) Try OpenAI if available
-        openai_key = os.getenv("OPENAI_API_KEY", "").strip()
-        openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
-        if openai_key:
-            analysis = await self._analyze_with_openai(openai_key, openai_model, weather_data, user_query)
-            if analysis:
-                return analysis
-
-        # 2) Try Hugging Face Inference API if token is available (often free tier)
-        hf_token = os.getenv("HF_API_TOKEN", "").strip()
-        hf_model = os.getenv("HF_MODEL", "HuggingFaceH4/zephyr-7b-beta").strip()
-        if hf_token:
-            analysis = await self._analyze_with_hf(hf_token, hf_model, weather_data, user_query)
-            if analysis:
-                return analysis
-
-        # 3) Try Ollama locally (can be disabled by setting OLLAMA_HOST="")
-        ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434").rstrip("/")
-        ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-        if ollama_host:
-            analysis = await self._analyze_with_ollama(ollama_host, ollama_model, weather_data, user_query)
-            if analysis:
-                return analysis
-
-        # 4) Fallback to rules
-        return self._rule_based_analysis(weather_data, user_query)
-
-    def _rule_based_analysis(self, weather_data: str, user_query: str) -> str:
-        """Improved heuristic analysis when LLM is unavailable."""
-        lines = weather_data.split('\n')
-        get = lambda key: next((l for l in lines if key in l), "")
-
-        # Parse values
-        temp = None
-        try:
-            tline = get('Temperature:')
-            if tline:
-                tpart = tline.split('Temperature:')[1].split('(')[0].strip()
-                temp = float(tpart.split('°')[0])
-        except Exception:
-            pass
-
-        feels = None
-        try:
-            if tline and '(' in tline:
-                fpart = tline.split('feels like')[-1].rstrip(')').strip()
-                feels = float(fpart.split('°')[0])
-        except Exception:
-            pass
-
-        desc = get('Conditions:').split(':',1)[-1].strip().lower()
-        hum = None
-        try:
-            hline = get('Humidity:')
-            if hline:
-                hum = int(hline.split(':')[1].strip('% '))
-        except Exception:
-            pass
+            return self._rule_based_analysis(weather_data, user_query, fields)
+        async def _run_once() -> str:
+            # The pooled client is bound to this temporary loop, so release it before the loop closes
+            try:
+                return await self.analyze_weather_with_llm_async(weather_data, user_query, fields)
+            finally:
+                await self._close_http()
 
-        wind = None
         try:
-            wline = get('Wind Speed:')
-            if wline:
-                wind = float(wline.split(':')[1].split()[0])
+            return asyncio.run(_run_once())
         except Exception:
-            pass
+            return self._rule_based_analysis(weather_data, user_query, fields)
 
-        vis = None
+    async def analyze_weather_with_llm_async(
+        self, weather_data: str, user_query: str, fields: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async analysis racing the configured backends (OpenAI, Hugging Face Inference API,
+        Ollama) and returning the first usable answer, falling back to rule-based analysis.
+        Pass the structured fields from get_weather_report to spare the fallback a re-parse.
+        """
+        cfg = _llm_config()
+        backends: List[Awaitable[Optional[str]]] = []
+
+        # OpenAI if available
+        if cfg.openai_key:
+            backends.append(self._analyze_with_openai(cfg.openai_key, cfg.openai_model, weather_data, user_query))
+
+        # Hugging Face Inference API if token is available (often free tier)
+        if cfg.hf_token:
+            backends.append(self._analyze_with_hf(cfg.hf_token, cfg.hf_model, weather_data, user_query))
+
+        # Ollama locally (can be disabled by setting OLLAMA_HOST="")
+        if cfg.ollama_host:
+            backends.append(self._analyze_with_ollama(cfg.ollama_host, cfg.ollama_model, weather_data, user_query))
+
+        return await self._race_backends(
+            backends, lambda: self._rule_based_analysis(weather_data, user_query, fields)
+        )
+
+    async def _race_backends(
+        self,
+        backends: List[Awaitable[Optional[str]]],
+        rule_based_fn: Callable[[], str],
+    ) -> str:
+        """
+        Run backends concurrently and return the first non-empty answer. When several
+        finish together the earlier (higher-priority) backend wins; the rest are cancelled.
+        Each backend gets a hard _LLM_DEADLINE so a hang in any layer falls through to rules.
+        """
+        tasks = [asyncio.ensure_future(asyncio.wait_for(backend, _LLM_DEADLINE)) for backend in backends]
+        pending = set(tasks)
         try:
-            vline = get('Visibility:')
-            if vline:
-                vis = int(''.join(ch for ch in vline if ch.isdigit()))
-        except Exception:
-            pass
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task in done and not task.cancelled() and task.exception() is None and task.result():
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # All backends failed or none configured: fall back to rules
+        return rule_based_fn()
+
+    def _rule_based_analysis(
+        self, weather_data: str, user_query: str, fields: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Improved heuristic analysis when LLM is unavailable; parses weather_data only if fields is None."""
+        # Parse values
+        if fields is None:
+            fields = _parse_weather_fields(weather_data)
+        temp = fields.get("temperature")
+        feels = fields.get("feels_like")
+        desc = fields.get("description", "").strip().lower()
+        hum = fields.get("humidity")
+        wind = fields.get("wind_speed")
+        vis = fields.get("visibility")
 
         tips: List[str] = []
 
         # Temperature-based clothing
         if temp is not None:
-            if temp <= 0:
-                tips.append("🥶 Very cold. Wear a heavy coat, gloves, and a hat.")
-            elif temp <= 10:
-                tips.append("🧥 Chilly. A warm jacket and layers are recommended.")
-            elif temp >= 30:
-                tips.append("🔥 Hot. Stay hydrated, wear light clothing, and limit midday sun.")
-            elif temp >= 22:
-                tips.append("🌞 Warm and comfortable. T‑shirt or light layers are fine.")
-            else:
-                tips.append("🌤️ Mild. A light layer should be enough.")
+            tips.append(_band_tip(temp, _TEMP_BANDS))
 
         # Feels-like adjustment
         if temp is not None and feels is not None:
-            delta = feels - temp
-            if delta <= -3:
-                tips.append("↘️ It feels colder than the actual temperature—add an extra layer.")
-            elif delta >= 3:
-                tips.append("↗️ It feels warmer than the actual temperature—dress lightly.")
+            tip = _band_tip(feels - temp, _FEELS_DELTA_BANDS)
+            if tip:
+                tips.append(tip)
 
         # Precipitation
-        if any(k in desc for k in ["rain", "drizzle", "thunder", "shower"]):
-            tips.append("☔ Rain expected. Carry an umbrella or waterproof layer.")
-        elif "snow" in desc:
-            tips.append("❄️ Snowy conditions. Wear insulated boots with good traction.")
+        if desc:
+            kinds = {m.lastgroup for m in _PRECIP_RE.finditer(desc)}
+            for kind, tip in _PRECIP_TIPS:
+                if kind in kinds:
+                    tips.append(tip)
+                    break
 
         # Humidity comfort
         if hum is not None:
-            if hum >= 80:
-                tips.append("💧 Very humid—expect it to feel muggy. Stay hydrated.")
-            elif hum <= 30:
-                tips.append("💨 Dry air—consider moisturizer and stay hydrated.")
+            tip = _band_tip(hum, _HUMIDITY_BANDS)
+            if tip:
+                tips.append(tip)
 
         # Wind advisories
         if wind is not None:
-            if wind >= 10:
-                tips.append("💨 Breezy to windy—secure hats/light items and consider a windbreaker.")
-            if wind >= 17:
-                tips.append("🌬️ Strong winds—extra caution for outdoor activities.")
+            tips.extend(_WIND_TIPS[:bisect.bisect_right(_WIND_THRESHOLDS, wind)])
 
         # Visibility
-        if vis is not None and vis < 3000:
+        if vis is not None and vis < _LOW_VISIBILITY:
             tips.append("👁️ Low visibility—take care if driving.")
 
         # Condition summary
         if desc:
             tips.append(f"ℹ️ Conditions: {desc.capitalize()}.")
 
-        return "\n".join(dict.fromkeys(tips))  # dedupe while preserving order
+        # Each tip comes from a distinct table or branch, so no dedupe pass is needed
+        return "\n".join(tips)
 
     async def _analyze_with_ollama(self, host: str, model: str, weather_data: str, user_query: str) -> Optional[str]:
         """Use local Ollama chat API to analyze weather. Returns None on failure."""
         try:
-            # Health check
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                # Quick ping to root
+            client = self._http_client()
+
+            # Health check: quick ping to root, cached for _OLLAMA_HEALTH_TTL seconds
+            now = time.monotonic()
+            if now >= self._ollama_checked_until:
                 try:
-                    await client.get(f"{host}/api/tags")
+                    await client.get(f"{host}/api/tags", timeout=5.0)
+                    self._ollama_alive = True
                 except Exception:
-                    return None
+                    self._ollama_alive = False
+                self._ollama_checked_until = now + _OLLAMA_HEALTH_TTL
+            if not self._ollama_alive:
+                return None
 
-                system_prompt = (
-                    "You are a helpful weather expert assistant. Based on the provided weather report, "
-                    "answer the user's question with concise, actionable advice. If clothing is relevant, "
-                    "give practical recommendations. Keep it to 2-4 short sentences."
-                )
+            system_prompt = (
+                "You are a helpful weather expert assistant. Based on the provided weather report, "
+                "answer the user's question with concise, actionable advice. If clothing is relevant, "
+                "give practical recommendations. Keep it to 2-4 short sentences."
+            )
 
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Weather report:\n{weather_data}\n\nUser question: {user_query}"},
-                ]
-
-                payload = {
-                    "model": model,
-                    "messages": messages,
-                    "stream": False,
-                }
-
-                resp = await client.post(f"{host}/api/chat", json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                # Ollama chat format: { 'message': {'role': 'assistant', 'content': '...'}, ... }
-                msg = data.get("message", {}).get("content")
-                if isinstance(msg, str) and msg.strip():
-                    return msg.strip()
-                return None
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"Weather report:\n{weather_data}\n\nUser question: {user_query}"},
+            ]
+
+            payload = {
+                "model": model,
+                "messages": messages,
+                "stream": True,
+            }
+
+            msg = await self._stream_ollama_chat(client, host, payload)
+            if msg.strip():
+                return msg.strip()
+            return None
         except Exception:
+            # Re-probe on the next call in case Ollama went away
+            self._ollama_checked_until = 0.0
             return None
 
+    async def _stream_ollama_chat(self, client: httpx.AsyncClient, host: str, payload: Dict[str, Any]) -> str:
+        """Collect a streamed Ollama chat reply chunk by chunk."""
+        parts: List[str] = []
+        async with client.stream(
+            "POST",
+            f"{host}/api/chat",
+            content=_json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=5.0,
+        ) as resp:
+            resp.raise_for_status()
+            # Streamed chat format: one JSON object per line,
+            # { 'message': {'role': 'assistant', 'content': '...'}, 'done': false }
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                content = chunk.get("message", {}).get("content")
+                if isinstance(content, str):
+                    parts.append(content)
+                if chunk.get("done"):
+                    break
+        return "".join(parts)
+
     async def _analyze_with_hf(self, api_token: str, model: str, weather_data: str, user_query: str) -> Optional[str]:
         """Use Hugging Face Inference API for text generation. Returns None on failure."""
         try:
@@ -317,21 +696,21 @@ class WeatherLLMClient:
                     "temperature": 0.7,
                     "return_full_text": False,
                 },
+                # A cold model rarely loads within _LLM_DEADLINE, so this mostly helps warm-ups already under way
                 "options": {"wait_for_model": True},
             }
 
             url = f"https://api-inference.huggingface.co/models/{model}"
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.post(url, json=payload, headers=headers)
-                if resp.status_code >= 400:
-                    return None
-                data = resp.json()
-                # Responses can be list of dicts with 'generated_text' or dict with 'error'
-                if isinstance(data, list) and data:
-                    gen = data[0].get("generated_text")
-                    if isinstance(gen, str) and gen.strip():
-                        return gen.strip()
+            resp = await self._http_client().post(url, content=_json_dumps(payload), headers=headers)
+            if resp.status_code >= 400:
                 return None
+            data = _json_loads(resp.content)
+            # Responses can be list of dicts with 'generated_text' or dict with 'error'
+            if isinstance(data, list) and data:
+                gen = data[0].get("generated_text")
+                if isinstance(gen, str) and gen.strip():
+                    return gen.strip()
+            return None
         except Exception:
             return None
 
@@ -358,18 +737,21 @@ class WeatherLLMClient:
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.post("https://api.openai.com/v1/chat/completions", json=payload, headers=headers)
-                if resp.status_code >= 400:
-                    return None
-                data = resp.json()
-                choices = data.get("choices", [])
-                if not choices:
-                    return None
-                msg = choices[0].get("message", {}).get("content")
-                if isinstance(msg, str) and msg.strip():
-                    return msg.strip()
+            resp = await self._http_client().post(
+                "https://api.openai.com/v1/chat/completions",
+                content=_json_dumps(payload),
+                headers=headers,
+            )
+            if resp.status_code >= 400:
                 return None
+            data = _json_loads(resp.content)
+            choices = data.get("choices", [])
+            if not choices:
+                return None
+            msg = choices[0].get("message", {}).get("content")
+            if isinstance(msg, str) and msg.strip():
+                return msg.strip()
+            return None
         except Exception:
             return None
     
@@ -378,25 +760,34 @@ class WeatherLLMClient:
         print("\n🌤️ Welcome to the Weather LLM Assistant!")
         print("Select a location by number or enter a custom one. Type 'quit' to exit.\n")
 
-        favorites = self._get_favorite_locations()
-        if not favorites:
-            favorites = [
-                "London, UK",
-                "New York, US",
-                "Tokyo, JP",
-                "Sydney, AU",
-            ]
+        favorites = self.favorite_locations
+
+        # Favorites are fixed for the session, so render the menu once
+        self._menu_text = self._format_menu(favorites)
+
+        try:
+            await self._chat_loop(favorites)
+        finally:
+            await self._drain_prefetch()
 
+    async def _chat_loop(self, favorites: Tuple[str, ...]):
+        """Menu/fetch/analyze loop behind chat_about_weather."""
         while True:
             try:
-                location = self._choose_location_from_menu(favorites)
+                # Warm up favorites while the user is choosing
+                self._prefetch_favorites(favorites)
+                location = await self._choose_location_from_menu(favorites)
                 if not location:
                     print("👋 Goodbye!")
                     break
 
                 print(f"\n🔍 Getting weather for {location}...")
-                weather_data = await self.get_weather(location)
-                analysis = await self.analyze_weather_with_llm_async(weather_data, f"Weather for {location}")
+                prefetched = self._take_prefetch(location)
+                if prefetched is not None:
+                    weather_data, fields = prefetched
+                else:
+                    weather_data, fields = await self.get_weather_report(location)
+                analysis = await self.analyze_weather_with_llm_async(weather_data, f"Weather for {location}", fields)
                 print(f"\nWeather Assistant:\n{weather_data}\n\n🤖 Analysis: {analysis}\n")
 
                 # Immediately loop back to select another location
@@ -410,6 +801,59 @@ class WeatherLLMClient:
                 # Loop back to selection on error as well
                 continue
     
+    def _prefetch_favorites(self, favorites: Tuple[str, ...]):
+        """Start background get_weather calls for favorites without a fresh prefetch in flight."""
+        if self._prefetch_limit is None:
+            self._prefetch_limit = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+        now = time.monotonic()
+        for location in favorites:
+            entry = self._prefetch.get(location)
+            if entry is not None and now - entry[0] < _PREFETCH_TTL:
+                continue
+            if entry is not None:
+                entry[1].cancel()
+            self._prefetch[location] = (now, asyncio.create_task(self._prefetch_weather(location)))
+
+    def _take_prefetch(self, location: str) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Claim the prefetched report for location if it finished successfully within
+        _PREFETCH_TTL; return None (leaving unfinished prefetches in place) to fetch it now.
+        """
+        entry = self._prefetch.get(location)
+        if entry is None:
+            return None
+        started, task = entry
+        if not task.done() or time.monotonic() - started >= _PREFETCH_TTL:
+            return None
+        del self._prefetch[location]
+        if task.cancelled() or task.exception() is not None:
+            return None
+        weather_data, fields = task.result()
+        # get_weather_report returns no fields with error text, so retry those
+        if fields is None:
+            return None
+        return weather_data, fields
+
+    async def _prefetch_weather(self, location: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """get_weather_report bounded by the prefetch concurrency limit."""
+        async with self._prefetch_limit:
+            return await self.get_weather_report(location)
+
+    async def _drain_prefetch(self):
+        """
+        Let outstanding prefetch tasks finish (cancelling stragglers) so no tool call
+        is still in flight when the MCP session is torn down.
+        """
+        tasks = [task for _, task in self._prefetch.values()]
+        self._prefetch.clear()
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=_PREFETCH_DRAIN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     def _extract_location(self, text: str) -> Optional[str]:
         """Extract location from user input (simple implementation)"""
         # Look for common location patterns
@@ -430,22 +874,27 @@ class WeatherLLMClient:
         
         return None
 
-    def _get_favorite_locations(self) -> List[str]:
-        """Return favorite locations from env FAVORITE_LOCATIONS (comma-separated)."""
-        raw = os.getenv("FAVORITE_LOCATIONS", "").strip()
-        if not raw:
-            return []
-        return [item.strip() for item in raw.split(",") if item.strip()]
+    @property
+    def favorite_locations(self) -> Tuple[str, ...]:
+        """Favorite locations from env FAVORITE_LOCATIONS (comma-separated, read once per process), else a default set."""
+        return _llm_config().favorite_locations or _DEFAULT_FAVORITES
+
+    @staticmethod
+    def _format_menu(favorites: Tuple[str, ...]) -> str:
+        """Render the numbered location menu shown by _choose_location_from_menu."""
+        return "Select a location:\n" + "".join(
+            f"  {idx}) {loc}\n" for idx, loc in enumerate(favorites, start=1)
+        ) + "  0) Enter another location"
 
-    def _choose_location_from_menu(self, favorites: List[str]) -> Optional[str]:
+    async def _choose_location_from_menu(self, favorites: Tuple[str, ...]) -> Optional[str]:
         """Prompt a numbered menu to choose a location, or allow custom entry."""
+        if self._menu_text is None:
+            self._menu_text = self._format_menu(favorites)
+
         while True:
-            print("Select a location:")
-            for idx, loc in enumerate(favorites, start=1):
-                print(f"  {idx}) {loc}")
-            print("  0) Enter another location")
+            sys.stdout.write(self._menu_text + "\n")
 
-            choice = input("Your choice (number or location): ").strip()
+            choice = (await ainput("Your choice (number or location): ")).strip()
             if choice.lower() in ["quit", "exit", "bye"]:
                 return None
             
@@ -454,7 +903,7 @@ class WeatherLLMClient:
                 num = int(choice)
                 if num == 0:
                     # custom prompt
-                    custom = input("Enter location (e.g., 'Paris, FR'): ").strip()
+                    custom = (await ainput("Enter location (e.g., 'Paris, FR'): ")).strip()
                     if custom:
                         return custom
                     continue
@@ -470,13 +919,51 @@ class WeatherLLMClient:
             print("Please enter a selection or a location.\n")
 
 
+_CLIENT_SINGLETON: Optional[WeatherLLMClient] = None
+_CLIENT_LOCK: Optional[asyncio.Lock] = None
+# Event loop the singleton's MCP session and lock belong to
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_client() -> Optional[WeatherLLMClient]:
+    """
+    Return a connected client shared across callers in this event loop, spawning the
+    MCP server process only once. Returns None if the server cannot be started.
+    """
+    global _CLIENT_SINGLETON, _CLIENT_LOCK, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT_LOOP is not loop:
+        # A session or lock left over from another loop (e.g. an earlier asyncio.run that did
+        # not call close_shared_client) cannot be used here, so start over on this loop
+        _CLIENT_SINGLETON = None
+        _CLIENT_LOCK = asyncio.Lock()
+        _CLIENT_LOOP = loop
+
+    async with _CLIENT_LOCK:
+        if _CLIENT_SINGLETON is None:
+            _CLIENT_SINGLETON = WeatherLLMClient()
+        if not await _CLIENT_SINGLETON.connect_to_mcp_server():
+            return None
+        return _CLIENT_SINGLETON
+
+
+async def close_shared_client():
+    """Disconnect the shared client and stop its MCP server process"""
+    global _CLIENT_SINGLETON, _CLIENT_LOCK, _CLIENT_LOOP
+    client, _CLIENT_SINGLETON = _CLIENT_SINGLETON, None
+    owner, _CLIENT_LOOP = _CLIENT_LOOP, None
+    _CLIENT_LOCK = None
+    # A session from another loop can no longer be closed from here; just drop it
+    if client is not None and owner is asyncio.get_running_loop():
+        await client.disconnect()
+
+
 async def main():
     """Main entry point"""
-    client = WeatherLLMClient()
-    
     try:
         # Connect to MCP server
-        if not await client.connect_to_mcp_server():
+        client = await get_shared_client()
+        if client is None:
             return
         
         # List available tools
@@ -492,8 +979,11 @@ async def main():
         print(f"❌ Error: {e}")
     
     finally:
-        await client.disconnect()
+        await close_shared_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
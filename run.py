@@ -12,7 +12,8 @@ from pathlib import Path
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from llm_weather_client import WeatherLLMClient
+from config import DEFAULT_LOCATION, DEFAULT_UNITS, OPENWEATHER_API_KEY
+from llm_weather_client import ainput, close_shared_client, get_shared_client
 
 
 async def main():
@@ -22,7 +23,7 @@ async def main():
 
     parser = argparse.ArgumentParser(description="Weather LLM Assistant")
     parser.add_argument("--location", "-l", help="Location to fetch weather for (e.g., 'London, UK')")
-    parser.add_argument("--units", "-u", choices=["metric", "imperial", "kelvin"], default=os.getenv("DEFAULT_UNITS", "metric"), help="Units for temperature and wind")
+    parser.add_argument("--units", "-u", choices=["metric", "imperial", "kelvin"], default=DEFAULT_UNITS, help="Units for temperature and wind")
     parser.add_argument("--forecast", "-f", action="store_true", help="Get 5-day forecast instead of current weather")
     parser.add_argument("--no-interactive", action="store_true", help="Run non-interactively and exit after printing results")
 
@@ -31,14 +32,11 @@ async def main():
     # Check if .env file exists
     if not os.path.exists(".env"):
         print("❌ Configuration file (.env) not found!")
-        print("   Please run 'python setup.py' first to set up the project.")
+        print("   Please run 'python scripts/bootstrap.py' first to set up the project.")
         return
 
     # Check if API key is configured
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    api_key = os.getenv("OPENWEATHER_API_KEY")
+    api_key = OPENWEATHER_API_KEY
     if not api_key or api_key == "your_api_key_here":
         print("❌ OpenWeatherMap API key not configured!")
         print("   Please:")
@@ -50,20 +48,20 @@ async def main():
     # Determine interactive mode
     interactive = not args.no_interactive
 
-    client = WeatherLLMClient()
-
     try:
-        if not await client.connect_to_mcp_server():
+        client = await get_shared_client()
+        if client is None:
             print("❌ Failed to start the weather assistant")
             print("   Try running 'python test_system.py' to diagnose issues")
             return
 
+        default_loc = DEFAULT_LOCATION
+
         # Interactive loop
         if interactive:
             while True:
                 try:
-                    default_loc = os.getenv("DEFAULT_LOCATION", "").strip()
-                    user_input = input("Enter location (e.g., 'London, UK') (type 'quit' to exit): ").strip()
+                    user_input = (await ainput("Enter location (e.g., 'London, UK') (type 'quit' to exit): ")).strip()
                     if user_input.lower() in {"quit", "exit", "q"}:
                         break
                     location = user_input or (default_loc or None)
@@ -77,7 +75,7 @@ async def main():
                         print("\nWhat would you like to see?")
                         print("  1) Current weather")
                         print("  2) 5-day forecast")
-                        choice = input("Choose 1 or 2: ").strip()
+                        choice = (await ainput("Choose 1 or 2: ")).strip()
                         forecast_choice = (choice == "2")
 
                     # Fetch and display
@@ -87,8 +85,8 @@ async def main():
                         print(text)
                     else:
                         print(f"🔍 Getting weather for {location}...")
-                        weather_text = await client.get_weather(location, units=args.units)
-                        analysis = client.analyze_weather_with_llm(weather_text, f"Weather for {location}")
+                        weather_text, fields = await client.get_weather_report(location, units=args.units)
+                        analysis = await client.analyze_weather_with_llm_async(weather_text, f"Weather for {location}", fields)
                         print(f"{weather_text}\n\n🤖 Analysis: {analysis}")
 
                     # loop back to prompt again
@@ -99,7 +97,7 @@ async def main():
             return
 
         # Non-interactive single run
-        location = args.location or os.getenv("DEFAULT_LOCATION")
+        location = args.location or default_loc
         if not location:
             print("❌ No location provided. Use --location or set DEFAULT_LOCATION in .env")
             return
@@ -109,8 +107,8 @@ async def main():
             print(text)
         else:
             print(f"🔍 Getting weather for {location}...")
-            weather_text = await client.get_weather(location, units=args.units)
-            analysis = client.analyze_weather_with_llm(weather_text, f"Weather for {location}")
+            weather_text, fields = await client.get_weather_report(location, units=args.units)
+            analysis = await client.analyze_weather_with_llm_async(weather_text, f"Weather for {location}", fields)
             print(f"{weather_text}\n\n🤖 Analysis: {analysis}")
         return
 
@@ -121,8 +119,11 @@ async def main():
         print(f"❌ Error: {e}")
 
     finally:
-        await client.disconnect()
+        await close_shared_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
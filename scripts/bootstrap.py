@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Bootstrap script for Weather LLM MCP Project
+
+Dependencies are installed from pyproject.toml with `pip install -e .` (or
+`uv pip install -e .`), which reuses pip's HTTP and wheel caches. This script
+prepares the local .env file and runs the system tests once an API key is set;
+pass --install to have it install dependencies as well.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import sysconfig
+from pathlib import Path
+
+# Repository root; everything below runs relative to it
+ROOT = Path(__file__).resolve().parent.parent
+
+# Fully pinned, hash-checked dependency set for this platform. Generate it with
+#   pip-compile --generate-hashes -o requirements.lock pyproject.toml
+# (or `uv pip compile --generate-hashes`) to let installs skip dependency resolution.
+LOCK_FILE = "requirements.lock"
+
+
+def run_command(argv, description):
+    """Run a command (an argument list, executed without a shell) and handle errors"""
+    print(f"📦 {description}...")
+    try:
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
+        print(f"✅ {description} completed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ {description} failed:")
+        print(f"   Error: {e.stderr}")
+        return False
+
+
+def install_dependencies():
+    """Install dependencies, bypassing the resolver when a hash-pinned lock file exists"""
+    pip = [sys.executable, "-m", "pip", "install", "--no-compile"]
+    if os.path.exists(LOCK_FILE):
+        if not run_command(
+            pip + ["--no-deps", "--require-hashes", "-r", LOCK_FILE],
+            "Installing pinned dependencies",
+        ):
+            return False
+        return run_command(pip + ["--no-deps", "-e", "."], "Installing project")
+
+    print(f"ℹ️  No {LOCK_FILE} found; resolving dependencies from pyproject.toml")
+    return run_command(pip + ["-e", "."], "Installing Python dependencies")
+
+
+def warm_bytecode():
+    """Precompile installed packages; installs skip this (--no-compile) and Python otherwise compiles on first import"""
+    site_packages = sysconfig.get_paths()["purelib"]
+    return run_command([sys.executable, "-m", "compileall", "-q", site_packages], "Precompiling installed packages")
+
+
+def main(argv=None):
+    """Main bootstrap function"""
+    parser = argparse.ArgumentParser(description="Set up the Weather LLM MCP project")
+    parser.add_argument("--install", action="store_true", help="Install dependencies before configuring")
+    parser.add_argument(
+        "--warm-bytecode",
+        action="store_true",
+        help="With --install, precompile site-packages instead of compiling lazily on first import",
+    )
+    args = parser.parse_args(argv)
+
+    print("🚀 Weather LLM MCP Project Setup")
+    print("=" * 50)
+
+    os.chdir(ROOT)
+    
+    # Check Python version
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required")
+        print(f"   Current version: {sys.version}")
+        return False
+    
+    print(f"✅ Python version: {sys.version.split()[0]}")
+    
+    # Install dependencies on request
+    if args.install:
+        if not install_dependencies():
+            return False
+        if args.warm_bytecode and not warm_bytecode():
+            return False
+    
+    # Create .env file if it doesn't exist
+    if not os.path.exists(".env"):
+        print("📝 Creating .env file...")
+        try:
+            with open(".env.example", "r") as src, open(".env", "w") as dst:
+                dst.write(src.read())
+            print("✅ .env file created from template")
+            print("   ⚠️  Please edit .env and add your OpenWeatherMap API key")
+        except Exception as e:
+            print(f"❌ Failed to create .env file: {e}")
+            return False
+    else:
+        print("✅ .env file already exists")
+    
+    # Check if API key is configured
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    api_key = os.getenv("OPENWEATHER_API_KEY")
+    if not api_key or api_key == "your_api_key_here":
+        print("⚠️  OpenWeatherMap API key not configured")
+        print("   Please:")
+        print("   1. Get a free API key from: https://openweathermap.org/api")
+        print("   2. Edit the .env file and replace 'your_api_key_here' with your actual key")
+        print("   3. Run 'python test_system.py' to verify the setup")
+    else:
+        print("✅ OpenWeatherMap API key found")
+        
+        # Run tests if API key is configured
+        print("\n🧪 Running system tests...")
+        if run_command([sys.executable, "test_system.py"], "System tests"):
+            print("\n🎉 Setup completed successfully!")
+            print("   You can now run 'python llm_weather_client.py' to start the weather assistant")
+        else:
+            print("\n⚠️  Setup completed but tests failed")
+            print("   Please check your API key and internet connection")
+    
+    print("\n" + "=" * 50)
+    print("Setup complete!")
+    
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
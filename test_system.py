@@ -6,10 +6,10 @@ Test script for the Weather LLM MCP system
 import asyncio
 import os
 import sys
-from llm_weather_client import WeatherLLMClient
+from llm_weather_client import WeatherLLMClient, ainput
 
 
-async def test_mcp_connection():
+async def test_mcp_connection(client):
     """Test MCP server connection and basic functionality"""
     print("🧪 Testing Weather LLM MCP System")
     print("=" * 50)
@@ -23,8 +23,6 @@ async def test_mcp_connection():
     
     print("✅ API key found")
     
-    client = WeatherLLMClient()
-    
     try:
         # Test MCP server connection
         print("\n🔌 Testing MCP server connection...")
@@ -34,40 +32,46 @@ async def test_mcp_connection():
         
         print("✅ MCP server connected successfully")
         
-        # Test listing tools
-        print("\n📋 Testing tool listing...")
-        tools = await client.list_available_tools()
-        print(f"✅ Found {len(tools)} tools:")
-        for tool in tools:
-            print(f"   • {tool['name']}: {tool['description']}")
-        
-        # Test weather fetching
-        print("\n🌤️ Testing weather fetching...")
+        # Tool listing, weather and forecast are independent, so fetch them together
+        print("\n📋 Testing tool listing, weather and forecast fetching...")
         test_location = "London, UK"
-        weather_data = await client.get_weather(test_location)
+        tools, weather_data, forecast_data = await asyncio.gather(
+            client.list_available_tools(),
+            client.get_weather(test_location),
+            client.get_forecast(test_location),
+            return_exceptions=True,
+        )
+        passed = True
         
-        if "Error" in weather_data:
-            print(f"❌ Weather fetch failed: {weather_data}")
-            return False
-        
-        print(f"✅ Weather data retrieved for {test_location}")
-        print(f"   Preview: {weather_data[:100]}...")
+        if isinstance(tools, Exception):
+            print(f"❌ Tool listing failed: {tools}")
+            passed = False
+        else:
+            print(f"✅ Found {len(tools)} tools:")
+            for tool in tools:
+                print(f"   • {tool['name']}: {tool['description']}")
         
-        # Test forecast fetching
-        print("\n📅 Testing forecast fetching...")
-        forecast_data = await client.get_forecast(test_location)
+        if isinstance(weather_data, Exception) or "Error" in weather_data:
+            print(f"❌ Weather fetch failed: {weather_data}")
+            passed = False
+        else:
+            print(f"✅ Weather data retrieved for {test_location}")
+            print(f"   Preview: {weather_data[:100]}...")
         
-        if "Error" in forecast_data:
+        if isinstance(forecast_data, Exception) or "Error" in forecast_data:
             print(f"❌ Forecast fetch failed: {forecast_data}")
-            return False
+            passed = False
+        else:
+            print(f"✅ Forecast data retrieved for {test_location}")
+            print(f"   Preview: {forecast_data[:100]}...")
         
-        print(f"✅ Forecast data retrieved for {test_location}")
-        print(f"   Preview: {forecast_data[:100]}...")
+        if not passed:
+            return False
         
         # Test LLM analysis
         print("\n🤖 Testing LLM analysis...")
         test_query = "Should I wear a jacket?"
-        analysis = client.analyze_weather_with_llm(weather_data, test_query)
+        analysis = await client.analyze_weather_with_llm_async(weather_data, test_query)
         print(f"✅ Analysis generated: {analysis}")
         
         print("\n🎉 All tests passed! The system is working correctly.")
@@ -76,25 +80,17 @@ async def test_mcp_connection():
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
         return False
-    
-    finally:
-        await client.disconnect()
 
 
-async def run_interactive_demo():
-    """Run a quick interactive demo"""
+async def run_interactive_demo(client):
+    """Run a quick interactive demo on the already connected client"""
     print("\n" + "=" * 50)
     print("🎮 Interactive Demo")
     print("=" * 50)
     
-    client = WeatherLLMClient()
-    
     try:
-        if not await client.connect_to_mcp_server():
-            return
-        
         print("Enter a location to get weather for (or 'skip' to skip demo):")
-        location = input("Location: ").strip()
+        location = (await ainput("Location: ")).strip()
         
         if location.lower() != 'skip' and location:
             print(f"\n🔍 Getting weather for {location}...")
@@ -102,14 +98,11 @@ async def run_interactive_demo():
             print(f"\n{weather_data}")
             
             # Simple analysis
-            analysis = client.analyze_weather_with_llm(weather_data, "What should I know about this weather?")
+            analysis = await client.analyze_weather_with_llm_async(weather_data, "What should I know about this weather?")
             print(f"\n🤖 Analysis: {analysis}")
     
     except Exception as e:
         print(f"❌ Demo failed: {e}")
-    
-    finally:
-        await client.disconnect()
 
 
 async def main():
@@ -117,14 +110,20 @@ async def main():
     print("Weather LLM MCP System Test Suite")
     print("=" * 50)
     
-    # Run basic tests
-    success = await test_mcp_connection()
+    # One client (and MCP server process) serves both the tests and the demo
+    client = WeatherLLMClient()
     
-    if success:
-        # Run interactive demo if tests pass
-        demo = input("\nWould you like to run an interactive demo? (y/n): ").strip().lower()
-        if demo in ['y', 'yes']:
-            await run_interactive_demo()
+    try:
+        # Run basic tests
+        success = await test_mcp_connection(client)
+        
+        if success:
+            # Run interactive demo if tests pass
+            demo = (await ainput("\nWould you like to run an interactive demo? (y/n): ")).strip().lower()
+            if demo in ['y', 'yes']:
+                await run_interactive_demo(client)
+    finally:
+        await client.disconnect()
     
     print("\n" + "=" * 50)
     print("Test complete!")
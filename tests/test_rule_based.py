@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests for the rule-based weather analysis
+
+The tip tables in llm_weather_client encode band edges for bisect, and _FIELD_RE replaces
+a line-by-line parser. These tests pin both to the original if/elif rules at every edge,
+for °C reports and for °F/K reports after unit conversion.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import itertools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from llm_weather_client import WeatherLLMClient, _coerce_weather_fields, _json_dumps  # noqa: E402
+
+
+def reference_analysis(temp, feels, desc, hum, wind, vis):
+    """The original if/elif rules, given values already in °C and m/s"""
+    tips = []
+    if temp is not None:
+        if temp <= 0:
+            tips.append("🥶 Very cold. Wear a heavy coat, gloves, and a hat.")
+        elif temp <= 10:
+            tips.append("🧥 Chilly. A warm jacket and layers are recommended.")
+        elif temp >= 30:
+            tips.append("🔥 Hot. Stay hydrated, wear light clothing, and limit midday sun.")
+        elif temp >= 22:
+            tips.append("🌞 Warm and comfortable. T‑shirt or light layers are fine.")
+        else:
+            tips.append("🌤️ Mild. A light layer should be enough.")
+
+    if temp is not None and feels is not None:
+        delta = feels - temp
+        if delta <= -3:
+            tips.append("↘️ It feels colder than the actual temperature—add an extra layer.")
+        elif delta >= 3:
+            tips.append("↗️ It feels warmer than the actual temperature—dress lightly.")
+
+    if any(k in desc for k in ["rain", "drizzle", "thunder", "shower"]):
+        tips.append("☔ Rain expected. Carry an umbrella or waterproof layer.")
+    elif "snow" in desc:
+        tips.append("❄️ Snowy conditions. Wear insulated boots with good traction.")
+
+    if hum is not None:
+        if hum >= 80:
+            tips.append("💧 Very humid—expect it to feel muggy. Stay hydrated.")
+        elif hum <= 30:
+            tips.append("💨 Dry air—consider moisturizer and stay hydrated.")
+
+    if wind is not None:
+        if wind >= 10:
+            tips.append("💨 Breezy to windy—secure hats/light items and consider a windbreaker.")
+        if wind >= 17:
+            tips.append("🌬️ Strong winds—extra caution for outdoor activities.")
+
+    if vis is not None and vis < 3000:
+        tips.append("👁️ Low visibility—take care if driving.")
+
+    if desc:
+        tips.append(f"ℹ️ Conditions: {desc.capitalize()}.")
+
+    return "\n".join(dict.fromkeys(tips))
+
+
+def build_report(temp, feels, desc, hum, wind, vis, temp_sym="°C", wind_unit="m/s"):
+    """Format a get_weather report like the server does, leaving out fields that are None"""
+    lines = ["Current Weather for Testville, TV:"]
+    if temp is not None:
+        line = f"🌡️ Temperature: {temp}{temp_sym}"
+        if feels is not None:
+            line += f" (feels like {feels}{temp_sym})"
+        lines.append(line)
+    if desc is not None:
+        lines.append(f"🌤️ Conditions: {desc.title()}")
+    if hum is not None:
+        lines.append(f"💧 Humidity: {hum}%")
+    if wind is not None:
+        lines.append(f"💨 Wind Speed: {wind} {wind_unit}")
+    lines.append("🔽 Pressure: 1013 hPa")
+    if vis is not None:
+        lines.append(f"👁️ Visibility: {vis} meters")
+    return "\n".join(lines)
+
+
+class RuleBasedAnalysisTest(unittest.TestCase):
+    """Rule-based tips agree with the original rules at every band edge"""
+
+    def setUp(self):
+        self.client = WeatherLLMClient()
+
+    def assertAnalysis(self, report, temp, feels, desc, hum, wind, vis):
+        expected = reference_analysis(temp, feels, (desc or "").lower(), hum, wind, vis)
+        self.assertEqual(self.client._rule_based_analysis(report, "q"), expected, report)
+
+    def test_celsius_edges_match_reference(self):
+        temps = [None, -0.1, 0, 0.1, 9.9, 10, 10.1, 21.9, 22, 22.1, 29.9, 30, 30.1]
+        deltas = [None, -3.1, -3, -2.9, 2.9, 3, 3.1]
+        humidities = [None, 29, 30, 31, 79, 80, 81]
+        winds = [None, 9.9, 10, 10.1, 16.9, 17, 17.1]
+        visibilities = [None, 2999, 3000]
+        descriptions = [None, "", "light rain", "snow", "rain and snow", "clear sky"]
+        for temp, delta, hum, wind, vis, desc in itertools.product(
+            temps, deltas, humidities, winds, visibilities, descriptions
+        ):
+            feels = None if temp is None or delta is None else round(temp + delta, 1)
+            report = build_report(temp, feels, desc, hum, wind, vis)
+            self.assertAnalysis(report, temp, feels, desc, hum, wind, vis)
+
+    def test_imperial_and_kelvin_edges_are_converted(self):
+        # (reported temperature, symbol, the same temperature in °C)
+        temperatures = [
+            (32.0, "°F", 0), (50.0, "°F", 10), (71.6, "°F", 22), (86.0, "°F", 30), (49.9, "°F", 9.94),
+            (273.15, "K", 0), (283.15, "K", 10), (295.15, "K", 22), (303.15, "K", 30), (283.25, "K", 10.1),
+        ]
+        # (reported mph, the same speed in m/s)
+        winds = [(12.0, 5.36), (22.37, 10.0), (22.3, 9.97), (38.03, 17.0), (38.0, 16.99)]
+        for (temp, sym, temp_c), (mph, mps) in itertools.product(temperatures, winds):
+            wind_unit = "mph" if sym == "°F" else "m/s"
+            wind = mph if sym == "°F" else mps
+            report = build_report(temp, None, "clear sky", 50, wind, 10000, temp_sym=sym, wind_unit=wind_unit)
+            self.assertAnalysis(report, temp_c, None, "clear sky", 50, mps, 10000)
+
+    def test_feels_like_delta_uses_celsius(self):
+        # 5.4 °F colder is exactly 3 °C colder; 5.3 °F is not
+        report = build_report(50.0, 44.6, None, None, None, None, temp_sym="°F")
+        self.assertAnalysis(report, 10, 7, None, None, None, None)
+        report = build_report(50.0, 44.7, None, None, None, None, temp_sym="°F")
+        self.assertAnalysis(report, 10, 7.06, None, None, None, None)
+
+    def test_empty_conditions_line_does_not_swallow_next_line(self):
+        report = "🌡️ Temperature: 15°C\n🌤️ Conditions: \n💧 Humidity: 10%"
+        self.assertAnalysis(report, 15, None, "", 10, None, None)
+
+    def test_structured_fields_match_text_report(self):
+        for units, sym, wind_unit in (("metric", "°C", "m/s"), ("imperial", "°F", "mph"), ("kelvin", "K", "m/s")):
+            temp = {"metric": 22.0, "imperial": 71.6, "kelvin": 295.15}[units]
+            payload = {
+                "temperature": temp,
+                "feels_like": temp,
+                "description": "Light Rain",
+                "humidity": 80,
+                "wind_speed": 22.37 if units == "imperial" else 10.0,
+                "visibility": 2999,
+                "units": units,
+            }
+            report = build_report(
+                temp, temp, "light rain", 80, payload["wind_speed"], 2999, temp_sym=sym, wind_unit=wind_unit
+            )
+            fields = _coerce_weather_fields(_json_dumps(payload))
+            self.assertEqual(
+                self.client._rule_based_analysis("", "q", fields),
+                self.client._rule_based_analysis(report, "q"),
+                units,
+            )
+
+    def test_unknown_units_drop_temperature_and_wind(self):
+        payload = {"temperature": 300.0, "wind_speed": 30.0, "humidity": 50, "units": "rankine"}
+        fields = _coerce_weather_fields(_json_dumps(payload))
+        self.assertEqual(fields, {"humidity": 50})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,11 +9,12 @@ It fetches weather data from OpenWeatherMap API and exposes it as MCP resources
 import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import quote
 
 import httpx
-from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -26,7 +27,49 @@ from mcp.types import (
     LoggingLevel,
     ServerCapabilities
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib codec is used instead
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# How long decoded OpenWeather responses are reused, in seconds. Current conditions
+# update roughly every few minutes, the forecast every three hours.
+_TTL_CURRENT = 60
+_TTL_FORECAST = 1800
+_CACHE_TTLS = {"/weather": _TTL_CURRENT, "/forecast": _TTL_FORECAST}
+_CACHE_MAX_ENTRIES = 1024
+
+# Display units per tool "units" value
+_TEMP_SYM = {"metric": "°C", "imperial": "°F", "kelvin": "K"}
+_WIND_UNIT = {"metric": "m/s", "kelvin": "m/s", "imperial": "mph"}
+
+# Text block for get_weather, filled from the tool's JSON fields plus the unit labels
+_CURRENT_TMPL = (
+    "Current Weather for {location}:\n"
+    "🌡️ Temperature: {temperature}{unit_symbol} (feels like {feels_like}{unit_symbol})\n"
+    "🌤️ Conditions: {description}\n"
+    "💧 Humidity: {humidity}%\n"
+    "💨 Wind Speed: {wind_speed} {wind_unit}\n"
+    "🔽 Pressure: {pressure} hPa\n"
+    "👁️ Visibility: {visibility} meters"
+)
 
 
 class WeatherData(BaseModel):
@@ -39,16 +82,44 @@ class WeatherData(BaseModel):
     feels_like: float
 
 
+class WeatherArgs(BaseModel):
+    """Arguments accepted by the weather tools"""
+    location: str
+    units: Literal["metric", "imperial", "kelvin"] = "metric"
+
+
+# Built once so each tool call reuses the compiled validator
+_WARGS = TypeAdapter(WeatherArgs)
+
+
 class WeatherMCPServer:
     """MCP Server for weather data"""
     
     def __init__(self):
-        # Load environment variables
-        load_dotenv()
+        # Load .env (with the same parser as the client) only when the parent process did not
+        # hand over the key; config is imported here because importing it reads .env
+        if not os.getenv("OPENWEATHER_API_KEY"):
+            from config import load_env
+            load_env()
 
         self.server = Server("weather-server")
         self.api_key = os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        # The key is fixed for the process, so encode the auth part of the query string once
+        self._auth_qs = f"appid={quote(self.api_key or '', safe='')}"
+
+        # One pooled client for the server's lifetime so keep-alive connections amortize TLS setup
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+        # Upstream fetches in flight, keyed by (path, location, units); concurrent
+        # identical requests await the same task instead of hitting the API again
+        self._inflight: Dict[Tuple[str, str, str], "asyncio.Task[Dict[str, Any]]"] = {}
+        # Recent responses as key -> (monotonic fetch time, data), kept in LRU order
+        self._cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
         # Register handlers
         self._register_handlers()
@@ -72,7 +143,7 @@ class WeatherMCPServer:
         async def handle_read_resource(uri: str) -> str:
             """Read weather resource"""
             if uri == "weather://current":
-                return json.dumps({
+                return _json_dumps({
                     "description": "Current weather resource",
                     "usage": "Use the get_weather tool to fetch current weather data",
                     "example": "get_weather(location='New York')"
@@ -123,183 +194,268 @@ class WeatherMCPServer:
                         },
                         "required": ["location"]
                     }
+                ),
+                Tool(
+                    name="get_weather_bundle",
+                    description="Get current weather and the 5-day forecast for a location in one call",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "location": {
+                                "type": "string",
+                                "description": "City name, state/country (e.g., 'New York, NY' or 'London, UK')"
+                            },
+                            "units": {
+                                "type": "string",
+                                "enum": ["metric", "imperial", "kelvin"],
+                                "default": "metric",
+                                "description": "Temperature units"
+                            }
+                        },
+                        "required": ["location"]
+                    }
                 )
             ]
         
+        tool_handlers = {
+            "get_weather": self._get_current_weather,
+            "get_forecast": self._get_weather_forecast,
+            "get_weather_bundle": self._get_bundle,
+        }
+
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls"""
-            if name == "get_weather":
-                return await self._get_current_weather(arguments)
-            elif name == "get_forecast":
-                return await self._get_weather_forecast(arguments)
-            else:
+            handler = tool_handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
-    
-    async def _get_current_weather(self, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Get current weather data"""
-        location = arguments.get("location")
-        units = arguments.get("units", "metric")
-        
-        if not self.api_key:
-            return [TextContent(
-                type="text",
-                text="Error: OPENWEATHER_API_KEY environment variable not set"
-            )]
-        
-        try:
-            async with httpx.AsyncClient() as client:
-                # OpenWeather accepts 'metric' or 'imperial'; Kelvin is default when units is omitted
-                api_units = None if units == "kelvin" else units
-                params = {
-                    "q": location,
-                    "appid": self.api_key,
-                }
-                if api_units:
-                    params["units"] = api_units
-                
-                response = await client.get(f"{self.base_url}/weather", params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                weather_info = {
-                    "location": f"{data['name']}, {data['sys']['country']}",
-                    "temperature": data['main']['temp'],
-                    "feels_like": data['main']['feels_like'],
-                    "description": data['weather'][0]['description'].title(),
-                    "humidity": data['main']['humidity'],
-                    "wind_speed": data['wind']['speed'],
-                    "pressure": data['main']['pressure'],
-                    "visibility": data.get('visibility', 'N/A'),
-                    "units": units
-                }
-                
-                # Format the response nicely
-                unit_symbol = "°C" if units == "metric" else "°F" if units == "imperial" else "K"
-                wind_unit = "m/s" if units in ("metric", "kelvin") else "mph"
-                
-                formatted_response = f"""Current Weather for {weather_info['location']}:
-🌡️ Temperature: {weather_info['temperature']}{unit_symbol} (feels like {weather_info['feels_like']}{unit_symbol})
-🌤️ Conditions: {weather_info['description']}
-💧 Humidity: {weather_info['humidity']}%
-💨 Wind Speed: {weather_info['wind_speed']} {wind_unit}
-🔽 Pressure: {weather_info['pressure']} hPa
-👁️ Visibility: {weather_info['visibility']} meters"""
-                
+
+            # Reject bad input here instead of spending an OpenWeather round-trip on it
+            try:
+                args = _WARGS.validate_python(arguments or {})
+            except ValidationError as e:
+                problems = "; ".join(
+                    f"{'.'.join(str(part) for part in err['loc']) or 'arguments'}: {err['msg']}"
+                    for err in e.errors()
+                )
                 return [TextContent(
                     type="text",
-                    text=formatted_response
+                    text=f"Error: invalid arguments for {name}: {problems}"
                 )]
-                
-        except httpx.HTTPStatusError as e:
+            return await handler(args)
+    
+    async def _fetch_json(self, path: str, location: str, units: str) -> Dict[str, Any]:
+        """
+        GET an OpenWeather endpoint and decode the JSON body. Fresh responses are served
+        from an in-memory TTL cache and identical concurrent requests are coalesced.
+        """
+        key = (path, location, units)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTLS.get(path, 0):
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            # The upstream GET runs in its own task so no single caller owns it
+            task = asyncio.ensure_future(self._fetch_upstream(key, path, location, units))
+            # Mark a failure retrieved even if every caller was cancelled before it finished
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        # Shield so one cancelled caller does not cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    async def _fetch_upstream(self, key: Tuple[str, str, str], path: str, location: str, units: str) -> Dict[str, Any]:
+        """Perform the GET behind _fetch_json and cache the decoded body; shared by every caller of key"""
+        try:
+            # Build the query string directly so httpx skips its params encoder.
+            # OpenWeather accepts 'metric' or 'imperial'; Kelvin is default when units is omitted
+            url = f"{path}?{self._auth_qs}&q={quote(location, safe='')}"
+            if units != "kelvin":
+                url += f"&units={units}"
+
+            # Stream the body in as raw bytes for the JSON decoder. It is read before the
+            # status check so error handlers can still use e.response.text once the stream closes.
+            async with self._http.stream("GET", url) as response:
+                body = await response.aread()
+                response.raise_for_status()
+            data = _json_loads(body)
+
+            self._cache[key] = (time.monotonic(), data)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _current_info(data: Dict[str, Any], units: str) -> Dict[str, Any]:
+        """Pick the current-weather fields clients use out of an OpenWeather /weather response"""
+        return {
+            "location": f"{data['name']}, {data['sys']['country']}",
+            "temperature": data['main']['temp'],
+            "feels_like": data['main']['feels_like'],
+            "description": data['weather'][0]['description'].title(),
+            "humidity": data['main']['humidity'],
+            "wind_speed": data['wind']['speed'],
+            "pressure": data['main']['pressure'],
+            "visibility": data.get('visibility', 'N/A'),
+            "units": units
+        }
+
+    @staticmethod
+    def _format_current(weather_info: Dict[str, Any], units: str) -> str:
+        """Render current-weather fields as text; unit labels are only needed here"""
+        return _CURRENT_TMPL.format_map(
+            {**weather_info, "unit_symbol": _TEMP_SYM[units], "wind_unit": _WIND_UNIT[units]}
+        )
+
+    @staticmethod
+    def _format_forecast(data: Dict[str, Any], units: str) -> str:
+        """Render an OpenWeather /forecast response as one line per day for up to 5 days"""
+        unit_symbol = _TEMP_SYM[units]
+
+        parts = [f"5-Day Weather Forecast for {data['city']['name']}, {data['city']['country']}:\n\n"]
+
+        # Single pass over the entries, indexing them by their 'dt' UNIX timestamp and recording
+        # per date [first index, count, 12:00 UTC timestamp]. 'dt_txt' is the same instant in UTC
+        # and OpenWeather lists entries chronologically, so each date's entries are contiguous.
+        items = data.get('list', [])
+        by_dt: Dict[int, Dict[str, Any]] = {}
+        days: Dict[str, List[Any]] = {}
+        for idx, item in enumerate(items):
+            dt = item.get('dt')
+            if dt is not None:
+                by_dt[dt] = item
+            date = item.get('dt_txt', '').partition(' ')[0]
+            day = days.get(date)
+            if day is None:
+                day = days[date] = [idx, 0, None if dt is None else dt - dt % 86400 + 43200]
+            day[1] += 1
+
+        # Sort dates and pick up to 5 days; prefer the 12:00:00 entry, else the middle one
+        for date in sorted(days)[:5]:
+            start, count, noon_ts = days[date]
+            forecast = by_dt.get(noon_ts) or items[start + count // 2]
+            temp = forecast['main']['temp']
+            desc = forecast['weather'][0]['description'].title()
+            humidity = forecast['main']['humidity']
+            parts.append(f"📅 {date}: {temp}{unit_symbol}, {desc}, Humidity: {humidity}%\n")
+
+        return "".join(parts)
+
+    @staticmethod
+    def _error_content(e: Exception, location: str, what: str) -> List[TextContent]:
+        """Turn a failed fetch into the error text returned to MCP clients"""
+        if isinstance(e, httpx.HTTPStatusError):
             if e.response.status_code == 404:
-                return [TextContent(
-                    type="text",
-                    text=f"Error: Location '{location}' not found. Please check the spelling and try again."
-                )]
+                text = f"Error: Location '{location}' not found. Please check the spelling and try again."
             else:
-                return [TextContent(
-                    type="text",
-                    text=f"Error fetching weather data: {e.response.status_code} - {e.response.text}"
-                )]
+                text = f"Error fetching {what} data: {e.response.status_code} - {e.response.text}"
+        else:
+            text = f"Error: {str(e)}"
+        return [TextContent(type="text", text=text)]
+
+    def _missing_key_content(self) -> Optional[List[TextContent]]:
+        """Error content when no API key is configured, otherwise None"""
+        if self.api_key:
+            return None
+        return [TextContent(
+            type="text",
+            text="Error: OPENWEATHER_API_KEY environment variable not set"
+        )]
+
+    async def _get_current_weather(self, args: WeatherArgs) -> List[TextContent]:
+        """Get current weather data"""
+        location, units = args.location, args.units
+        missing_key = self._missing_key_content()
+        if missing_key:
+            return missing_key
+        
+        try:
+            data = await self._fetch_json("/weather", location, units)
+            weather_info = self._current_info(data, units)
+            
+            # Second block carries the same values as JSON so clients can skip re-parsing the text
+            return [
+                TextContent(type="text", text=self._format_current(weather_info, units)),
+                TextContent(type="text", text=_json_dumps(weather_info)),
+            ]
+            
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error: {str(e)}"
-            )]
+            return self._error_content(e, location, "weather")
     
-    async def _get_weather_forecast(self, arguments: Dict[str, Any]) -> List[TextContent]:
+    async def _get_weather_forecast(self, args: WeatherArgs) -> List[TextContent]:
         """Get weather forecast data"""
-        location = arguments.get("location")
-        units = arguments.get("units", "metric")
+        location, units = args.location, args.units
+        missing_key = self._missing_key_content()
+        if missing_key:
+            return missing_key
         
-        if not self.api_key:
+        try:
+            data = await self._fetch_json("/forecast", location, units)
             return [TextContent(
                 type="text",
-                text="Error: OPENWEATHER_API_KEY environment variable not set"
+                text=self._format_forecast(data, units)
             )]
+            
+        except Exception as e:
+            return self._error_content(e, location, "forecast")
+    
+    async def _get_bundle(self, args: WeatherArgs) -> List[TextContent]:
+        """Get current weather and forecast together, fetching both endpoints concurrently"""
+        location, units = args.location, args.units
+        missing_key = self._missing_key_content()
+        if missing_key:
+            return missing_key
         
         try:
-            async with httpx.AsyncClient() as client:
-                # OpenWeather accepts 'metric' or 'imperial'; Kelvin is default when units is omitted
-                api_units = None if units == "kelvin" else units
-                params = {
-                    "q": location,
-                    "appid": self.api_key,
-                }
-                if api_units:
-                    params["units"] = api_units
-
-                response = await client.get(f"{self.base_url}/forecast", params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Format forecast data
-                unit_symbol = "°C" if units == "metric" else "°F" if units == "imperial" else "K"
-
-                forecast_text = f"5-Day Weather Forecast for {data['city']['name']}, {data['city']['country']}:\n\n"
-
-                # Group all entries by date
-                by_date: Dict[str, List[Dict[str, Any]]] = {}
-                for item in data.get('list', []):
-                    dt_txt = item.get('dt_txt', '')
-                    date = dt_txt.split(' ')[0] if ' ' in dt_txt else dt_txt
-                    by_date.setdefault(date, []).append(item)
-
-                # Sort dates and pick up to 5 days
-                dates = sorted(by_date.keys())[:5]
-
-                def pick_representative(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-                    # Prefer 12:00:00 entry if present, else choose middle entry
-                    noon = [e for e in entries if e.get('dt_txt', '').endswith('12:00:00')]
-                    if noon:
-                        return noon[0]
-                    return entries[len(entries)//2]
-
-                for date in dates:
-                    entries = by_date[date]
-                    forecast = pick_representative(entries)
-                    temp = forecast['main']['temp']
-                    desc = forecast['weather'][0]['description'].title()
-                    humidity = forecast['main']['humidity']
-                    forecast_text += f"📅 {date}: {temp}{unit_symbol}, {desc}, Humidity: {humidity}%\n"
-                
-                return [TextContent(
-                    type="text",
-                    text=forecast_text
-                )]
-                
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return [TextContent(
-                    type="text",
-                    text=f"Error: Location '{location}' not found. Please check the spelling and try again."
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"Error fetching forecast data: {e.response.status_code} - {e.response.text}"
-                )]
-        except Exception as e:
+            current, forecast = await asyncio.gather(
+                self._fetch_json("/weather", location, units),
+                self._fetch_json("/forecast", location, units),
+            )
+            text = self._format_current(self._current_info(current, units), units)
             return [TextContent(
                 type="text",
-                text=f"Error: {str(e)}"
+                text=f"{text}\n\n{self._format_forecast(forecast, units)}"
             )]
+            
+        except Exception as e:
+            return self._error_content(e, location, "weather")
     
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        await self._http.aclose()
+
+    async def _prewarm(self):
+        """Open the pooled connection (DNS, TCP, TLS, HTTP/2 settings) before the first tool call"""
+        try:
+            # Unauthenticated HEAD: enough to establish the connection without spending API quota
+            await self._http.head("/weather")
+        except Exception:
+            pass  # Offline or unreachable; the first real request connects instead
+
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="weather-server",
-                    server_version="1.0.0",
-                    capabilities=ServerCapabilities(),
-                ),
-            )
+        # Warm the connection concurrently with the MCP handshake rather than delaying startup
+        prewarm = asyncio.ensure_future(self._prewarm()) if self.api_key else None
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="weather-server",
+                        server_version="1.0.0",
+                        capabilities=ServerCapabilities(),
+                    ),
+                )
+        finally:
+            if prewarm is not None:
+                prewarm.cancel()
+                await asyncio.gather(prewarm, return_exceptions=True)
+            await self.aclose()
 
 
 async def main():